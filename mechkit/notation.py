@@ -6,6 +6,73 @@ import numpy as np
 from mechkit.utils import Ex
 
 
+# Tensor index pairs (i, j) of Mandel6 components, Mandel6 component of
+# flattened tensor index pair 3 * i + j and scaling of Mandel6 components.
+# Kernels read these tuples as compile time constants.
+_I6 = (0, 1, 2, 1, 0, 0)
+_J6 = (0, 1, 2, 2, 2, 1)
+_INDEX6 = (0, 5, 4, 5, 1, 3, 4, 3, 2)
+_SCALE6 = (1.0, 1.0, 1.0, np.sqrt(2.0), np.sqrt(2.0), np.sqrt(2.0))
+
+
+def _tensor4_to_mandel6_kernel(inp, out):
+    """Loop version of Converter._tensor4_to_mandel6 compiled by numba"""
+    for a in range(6):
+        i, j = _I6[a], _J6[a]
+        for b in range(6):
+            k, l = _I6[b], _J6[b]
+            out[a, b] = (0.25 * _SCALE6[a] * _SCALE6[b]) * (
+                inp[i, j, k, l] + inp[j, i, k, l] + inp[i, j, l, k] + inp[j, i, l, k]
+            )
+
+
+def _mandel6_4_to_tensor_kernel(inp, out):
+    """Loop version of Converter._mandel6_4_to_tensor compiled by numba"""
+    for i in range(3):
+        for j in range(3):
+            a = _INDEX6[3 * i + j]
+            for k in range(3):
+                for l in range(3):
+                    b = _INDEX6[3 * k + l]
+                    out[i, j, k, l] = inp[a, b] / (_SCALE6[a] * _SCALE6[b])
+
+
+_KERNEL_FUNCTIONS = {
+    "tensor4_to_mandel6": _tensor4_to_mandel6_kernel,
+    "mandel6_4_to_tensor": _mandel6_4_to_tensor_kernel,
+}
+
+# Dtypes the kernels are compiled for, e.g. numba supports no float16
+_KERNEL_DTYPES = frozenset(
+    np.dtype(t) for t in ("float32", "float64", "complex64", "complex128")
+)
+
+# Compiled kernels by name, None until first use, empty without numba
+_kernels = None
+
+
+def _get_kernel(name, dtype):
+    """Get kernel compiled by numba for arrays of dtype, None if numba is
+    not installed or does not support dtype
+
+    numba is imported and the kernels are compiled on first use,
+    which keeps numba out of the import of mechkit.
+    """
+    global _kernels
+    if dtype not in _KERNEL_DTYPES:
+        return None
+    if _kernels is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _kernels = {}
+        else:
+            _kernels = {
+                key: njit(cache=True)(func) for key, func in _KERNEL_FUNCTIONS.items()
+            }
+    return _kernels.get(name)
+
+
 class Converter(object):
     r"""
     Convert numerical tensors from one notation to another.
@@ -27,8 +94,26 @@ class Converter(object):
         - 2. order tensor: (9,)
         - 4. order tensor: (9, 9)
 
+    Inputs are cast to the dtype of the converter, e.g.
+    Converter(dtype="float32") converts in single precision.
+
+    Additional leading axes are treated as batch axes, e.g. an input of
+    shape (100, 3, 3, 3, 3) holds 100 fourth order tensors.
+    Shapes listed above are never interpreted as batches, i.e. (6, 6) is
+    one fourth order tensor and not six second order tensors.
+    For other shapes, fourth order tensors take precedence.
+
     References and theory can be found in the method descriptions below.
 
+    If numba is installed, conversions of fourth order tensors between
+    tensor and Mandel6 notation are done by compiled kernels
+    for dtypes float32, float64, complex64 and complex128.
+    Install them with pip install mechkit[numba].
+    The first conversion in each direction compiles its kernel, which
+    takes a fraction of a second, as does the first input of a new memory
+    layout, e.g. Fortran ordered. numba caches compiled kernels on disk
+    for later sessions.
+
     Methods
     -------
     to_tensor(inp)
@@ -43,6 +128,27 @@ class Converter(object):
     to_like(inp, like)
         Convert input to notation of like
 
+    is_tensor(inp)
+        Check whether input is in tensor notation
+
+    is_mandel6(inp)
+        Check whether input is in Mandel6 notation
+
+    is_mandel9(inp)
+        Check whether input is in Mandel9 notation
+
+    symmetrize_minor(tensor)
+        Get left- and right- minor symmetric part of fourth order tensor
+
+    compile_to_tensor(shape)
+        Get conversion to tensor notation for inputs of fixed shape
+
+    compile_to_mandel6(shape)
+        Get conversion to Mandel6 notation for inputs of fixed shape
+
+    compile_to_mandel9(shape)
+        Get conversion to Mandel9 notation for inputs of fixed shape
+
     Examples
     --------
     >>> import numpy as np
@@ -128,18 +234,145 @@ class Converter(object):
 
     """
 
+    # Bases depend on dtype only and are shared between all instances
+    _BASE_CACHE = {}
+
     def __init__(self, dtype="float64"):
 
         self.dtype = dtype
-        self.factor = np.sqrt(2.0) / 2.0
+        self.factor = np.dtype(dtype).type(np.sqrt(2.0) / 2.0)
 
         self.DIM = 3
         self.DIM_MANDEL6 = 6
         self.DIM_MANDEL9 = 9
         self.SLICE6 = np.s_[0:6]
+        self.SLICE_SKW = np.s_[6:9]
         self.BASE6 = self.get_mandel_base_sym()
         self.BASE9 = self.get_mandel_base_skw()
 
+        # Mandel6 index of tensor index pair (i, j) and vice versa
+        self.INDEX6 = np.array(_INDEX6).reshape(self.DIM, self.DIM)
+        i = np.array(_I6)
+        j = np.array(_J6)
+        scale = np.array(_SCALE6, dtype=dtype)
+
+        # Index tuples start with an ellipsis to support leading batch axes.
+
+        # Mandel6 components of second order tensors are gathered from the
+        # symmetric partners of each tensor component, averaged and scaled
+        # by sqrt(2) for shear components
+        self._tensor2_to_mandel6_index = ((Ellipsis, i, j), (Ellipsis, j, i))
+        self._tensor2_to_mandel6_scale = 0.5 * scale
+
+        self._mandel6_2_to_tensor_index = (Ellipsis, self.INDEX6)
+        self._mandel6_2_to_tensor_scale = 1.0 / scale[self.INDEX6]
+
+        # Position of each fourth order tensor component in the flattened
+        # Mandel6 matrix and scaling, both flattened to 81 components
+        M, N = self.INDEX6[:, :, None, None], self.INDEX6[None, None, :, :]
+        self._mandel6_4_to_tensor_flat_index = np.ravel(M * self.DIM_MANDEL6 + N)
+        self._mandel6_4_to_tensor_flat_scale = np.ravel(1.0 / (scale[M] * scale[N]))
+
+        # Each Mandel9 base dyad has nonzero entries at (i, j) and (j, i)
+        # only, with signs given by the base. Diagonal dyads are split into
+        # two halves at (i, i). Vice versa, each tensor component (i, j)
+        # contributes to one symmetric and one skew Mandel9 component.
+        i9 = np.array([0, 1, 2, 1, 0, 0, 1, 0, 0])
+        j9 = np.array([0, 1, 2, 2, 2, 1, 2, 2, 1])
+        half9 = np.where(i9 == j9, 0.5, 1.0).astype(dtype)
+        rows = np.arange(self.DIM_MANDEL9)
+        self._tensor2_to_mandel9_terms = [
+            ((Ellipsis, i9, j9), half9 * self.BASE9[rows, i9, j9]),
+            ((Ellipsis, j9, i9), half9 * self.BASE9[rows, j9, i9]),
+        ]
+
+        diagonal = np.eye(self.DIM, dtype=bool)
+        sym = self.INDEX6
+        skw = np.where(diagonal, self.INDEX6, self.INDEX6 + 3)
+        half = np.where(diagonal, 0.5, 1.0).astype(dtype)
+        ii, jj = np.indices((self.DIM, self.DIM))
+        self._mandel9_2_to_tensor_terms = [
+            ((Ellipsis, sym), half * self.BASE9[sym, ii, jj]),
+            ((Ellipsis, skw), half * self.BASE9[skw, ii, jj]),
+        ]
+
+        # Bases as matrices acting on flattened index pairs (i, j), such
+        # that fourth order conversions reduce to two matrix products
+        self._base6_matrix = self.BASE6.reshape(self.DIM_MANDEL6, self.DIM ** 2)
+        self._base9_matrix = self.BASE9.reshape(self.DIM_MANDEL9, self.DIM ** 2)
+
+        dim = (self.DIM,)
+        dim_mandel6 = (self.DIM_MANDEL6,)
+        dim_mandel9 = (self.DIM_MANDEL9,)
+
+        self._types_by_shape = {
+            2 * dim: "t_2",
+            4 * dim: "t_4",
+            1 * dim_mandel6: "m6_2",
+            2 * dim_mandel6: "m6_4",
+            1 * dim_mandel9: "m9_2",
+            2 * dim_mandel9: "m9_4",
+        }
+
+        # Leading axes of other shapes are batch axes. Fourth order
+        # types are checked first.
+        self._types_by_trailing_shape = [
+            (4 * dim, "t_4"),
+            (2 * dim_mandel6, "m6_4"),
+            (2 * dim_mandel9, "m9_4"),
+            (2 * dim, "t_2"),
+            (1 * dim_mandel6, "m6_2"),
+            (1 * dim_mandel9, "m9_2"),
+        ]
+
+        self._to_mandel6_functions = {
+            "t_2": self._tensor2_to_mandel6,
+            "t_4": self._tensor4_to_mandel6,
+            "m6_2": self._pass_through,
+            "m6_4": self._pass_through,
+            "m9_2": self._mandel9_2_to_mandel6,
+            "m9_4": self._mandel9_4_to_mandel6,
+        }
+
+        self._to_mandel9_functions = {
+            "t_2": self._tensor2_to_mandel9,
+            "t_4": self._tensor4_to_mandel9,
+            "m6_2": self._mandel6_2_to_mandel9,
+            "m6_4": self._mandel6_4_to_mandel9,
+            "m9_2": self._pass_through,
+            "m9_4": self._pass_through,
+        }
+
+        self._to_tensor_functions = {
+            "t_2": self._pass_through,
+            "t_4": self._pass_through,
+            "m6_2": self._mandel6_2_to_tensor,
+            "m6_4": self._mandel6_4_to_tensor,
+            "m9_2": self._mandel9_2_to_tensor,
+            "m9_4": self._mandel9_4_to_tensor,
+        }
+
+        # Inputs of these shapes and dtype are returned unchanged
+        self._numpy_dtype = np.dtype(dtype)
+        self._mandel6_shapes = frozenset([1 * dim_mandel6, 2 * dim_mandel6])
+        self._mandel9_shapes = frozenset([1 * dim_mandel9, 2 * dim_mandel9])
+        self._tensor_shapes = frozenset([2 * dim, 4 * dim])
+
+        # Conversions keyed by exact input shape, skipping the type lookup
+        self._to_mandel6_by_shape = {}
+        self._to_mandel9_by_shape = {}
+        self._to_tensor_by_shape = {}
+        for shape, type_ in self._types_by_shape.items():
+            self._to_mandel6_by_shape[shape] = self._to_mandel6_functions[type_]
+            self._to_mandel9_by_shape[shape] = self._to_mandel9_functions[type_]
+            self._to_tensor_by_shape[shape] = self._to_tensor_functions[type_]
+
+        self._to_like_functions = {
+            "t_": self.to_tensor,
+            "m6": self.to_mandel6,
+            "m9": self.to_mandel9,
+        }
+
     def get_mandel_base_sym(self,):
         r"""Get orthonormal basis of Mandel6 representation introduced by
         [Mandel1965]_, [Fedorov1968]_, [Mehrabadi1990]_  and
@@ -294,8 +527,13 @@ class Converter(object):
         -------
         np.array with shape (6, 3, 3)
                 B(i, :, :) is the i-th dyade of the base.
+                The array is read-only, as it is shared between instances.
         """
 
+        key = ("sym", np.dtype(self.dtype))
+        if key in self._BASE_CACHE:
+            return self._BASE_CACHE[key]
+
         B = np.zeros((self.DIM_MANDEL6, self.DIM, self.DIM), dtype=self.dtype,)
 
         B[0, 0, 0] = 1.0
@@ -304,6 +542,9 @@ class Converter(object):
         B[3, 1, 2] = B[3, 2, 1] = self.factor
         B[4, 0, 2] = B[4, 2, 0] = self.factor
         B[5, 0, 1] = B[5, 1, 0] = self.factor
+
+        B.setflags(write=False)
+        self._BASE_CACHE[key] = B
         return B
 
     def get_mandel_base_skw(self,):
@@ -372,8 +613,13 @@ class Converter(object):
         -------
         np.array with shape (9, 3, 3)
                 B(i, :, :) is the i-th dyade of the base.
+                The array is read-only, as it is shared between instances.
         """
 
+        key = ("skw", np.dtype(self.dtype))
+        if key in self._BASE_CACHE:
+            return self._BASE_CACHE[key]
+
         B = np.zeros((self.DIM_MANDEL9, self.DIM, self.DIM), dtype=self.dtype,)
         B[0:6, :, :] = self.get_mandel_base_sym()
 
@@ -383,6 +629,9 @@ class Converter(object):
         B[7, 2, 0] = -self.factor
         B[8, 0, 1] = -self.factor
         B[8, 1, 0] = self.factor
+
+        B.setflags(write=False)
+        self._BASE_CACHE[key] = B
         return B
 
     def to_mandel6(self, inp, verbose=False):
@@ -402,8 +651,14 @@ class Converter(object):
         if verbose:
             print("Skew parts are lost!")
 
-        f = self._get_to_mandel6_func(inp=inp)
-        return f(inp=inp)
+        if inp.shape in self._mandel6_shapes and inp.dtype == self._numpy_dtype:
+            return inp
+
+        try:
+            f = self._to_mandel6_by_shape[inp.shape]
+        except KeyError:
+            f = self._get_to_mandel6_func(inp=inp)
+        return f(inp)
 
     def to_mandel9(self, inp):
         """Convert to Mandel9 notation
@@ -419,8 +674,14 @@ class Converter(object):
             Input in Mandel9 notation
         """
 
-        f = self._get_to_mandel9_func(inp=inp)
-        return f(inp=inp)
+        if inp.shape in self._mandel9_shapes and inp.dtype == self._numpy_dtype:
+            return inp
+
+        try:
+            f = self._to_mandel9_by_shape[inp.shape]
+        except KeyError:
+            f = self._get_to_mandel9_func(inp=inp)
+        return f(inp)
 
     def to_tensor(self, inp):
         """Convert to tensor notation
@@ -436,8 +697,14 @@ class Converter(object):
             Input in tensor notation
         """
 
-        f = self._get_to_tensor_func(inp=inp)
-        return f(inp=inp)
+        if inp.shape in self._tensor_shapes and inp.dtype == self._numpy_dtype:
+            return inp
+
+        try:
+            f = self._to_tensor_by_shape[inp.shape]
+        except KeyError:
+            f = self._get_to_tensor_func(inp=inp)
+        return f(inp)
 
     def to_like(self, inp, like):
         """Convert input to notation of like
@@ -457,135 +724,370 @@ class Converter(object):
         """
 
         type_like = self._get_type_by_shape(like)
+        return self._to_like_functions[type_like[0:2]](inp)
 
-        functions = {
-            "t_": self.to_tensor,
-            "m6": self.to_mandel6,
-            "m9": self.to_mandel9,
-        }
+    def is_mandel6(self, inp):
+        """Check whether input is in Mandel6 notation, judged by its shape.
+        to_mandel6 returns such inputs unchanged, if their dtype equals the
+        dtype of the converter.
+
+        Parameters
+        ----------
+        inp : np.array with unknown shape
+            Input
 
-        return functions[type_like[0:2]](inp)
+        Returns
+        -------
+        bool
+        """
 
-    def _get_type_by_shape(self, inp):
-        dim = (self.DIM,)
-        dim_mandel6 = (self.DIM_MANDEL6,)
-        dim_mandel9 = (self.DIM_MANDEL9,)
+        return self._get_notation(inp) == "m6"
 
-        types = {
-            2 * dim: "t_2",
-            4 * dim: "t_4",
-            1 * dim_mandel6: "m6_2",
-            2 * dim_mandel6: "m6_4",
-            1 * dim_mandel9: "m9_2",
-            2 * dim_mandel9: "m9_4",
-        }
+    def is_mandel9(self, inp):
+        """Check whether input is in Mandel9 notation, see is_mandel6.
+
+        Parameters
+        ----------
+        inp : np.array with unknown shape
+            Input
+
+        Returns
+        -------
+        bool
+        """
+
+        return self._get_notation(inp) == "m9"
+
+    def is_tensor(self, inp):
+        """Check whether input is in tensor notation, see is_mandel6.
+
+        Parameters
+        ----------
+        inp : np.array with unknown shape
+            Input
+
+        Returns
+        -------
+        bool
+        """
+
+        return self._get_notation(inp) == "t_"
+
+    def _get_notation(self, inp):
+        try:
+            return self._get_type_by_shape(inp)[0:2]
+        except Ex:
+            return None
+
+    def symmetrize_minor(self, tensor):
+        r"""Get left- and right- minor symmetric part of fourth order tensor
+
+        .. math::
+            \begin{align*}
+                \frac{1}{4}\left(
+                    A_{ijkl} + A_{jikl} + A_{ijlk} + A_{jilk}
+                \right)
+            \end{align*}
+
+        The sum is accumulated in place, allocating one output array only.
+
+        Parameters
+        ----------
+        tensor : np.array with shape (..., 3, 3, 3, 3)
+            Fourth order tensor in tensor notation
+
+        Returns
+        -------
+        np.array with same shape as tensor and dtype of converter
+            Minor symmetric part of tensor
+        """
+
+        tensor = np.asarray(tensor)
+        swapped = tensor.swapaxes(-4, -3)
+        out = tensor.astype(self.dtype)
+        out += swapped
+        out += tensor.swapaxes(-2, -1)
+        out += swapped.swapaxes(-2, -1)
+        out *= 0.25
+        return out
+
+    def compile_to_mandel6(self, shape):
+        """Get conversion to Mandel6 notation for inputs of fixed shape
+
+        The shape of the input is analyzed once, instead of in every call
+        of to_mandel6. Get the conversion outside of loops converting
+        many inputs of equal shape.
+
+        Parameters
+        ----------
+        shape : tuple
+            Shape of inputs
+
+        Returns
+        -------
+        function
+            Conversion taking the input as only argument
+
+        Examples
+        --------
+        >>> con = mechkit.notation.Converter()
+        >>> stiffnesses = np.random.rand(100, 3, 3, 3, 3)
+        >>> to_mandel6 = con.compile_to_mandel6(shape=(3, 3, 3, 3))
+        >>> stiffnesses_mandel6 = [to_mandel6(s) for s in stiffnesses]
+        """
+
+        return self._to_mandel6_functions[self._get_type(shape)]
+
+    def compile_to_mandel9(self, shape):
+        """Get conversion to Mandel9 notation for inputs of fixed shape
+
+        See compile_to_mandel6.
+        Conversions from Mandel6 notation, i.e. shapes (..., 6) and
+        (..., 6, 6), accept a preallocated output as keyword argument out,
+        which avoids a new array for each call.
+
+        Parameters
+        ----------
+        shape : tuple
+            Shape of inputs
+
+        Returns
+        -------
+        function
+            Conversion taking the input as first argument.
+            For inputs in Mandel6 notation, the conversion also takes
+            out, an array with the shape of the result and the dtype of
+            the converter. The result is written into out and returned,
+            i.e. it is overwritten by the next call with the same out.
+            For other shapes, out is not accepted.
+
+        Examples
+        --------
+        Each stiffness_mandel9 is out and is overwritten in the next
+        iteration, so copy it to keep it.
+
+        >>> con = mechkit.notation.Converter()
+        >>> stiffnesses_mandel6 = np.random.rand(100, 6, 6)
+        >>> to_mandel9 = con.compile_to_mandel9(shape=(6, 6))
+        >>> out = np.empty((9, 9))
+        >>> for stiffness in stiffnesses_mandel6:
+        ...     stiffness_mandel9 = to_mandel9(stiffness, out=out)
+        """
 
+        return self._to_mandel9_functions[self._get_type(shape)]
+
+    def compile_to_tensor(self, shape):
+        """Get conversion to tensor notation for inputs of fixed shape
+
+        See compile_to_mandel6.
+
+        Parameters
+        ----------
+        shape : tuple
+            Shape of inputs
+
+        Returns
+        -------
+        function
+            Conversion taking the input as only argument
+        """
+
+        return self._to_tensor_functions[self._get_type(shape)]
+
+    def _get_type_by_shape(self, inp):
+        return self._get_type(inp.shape)
+
+    def _get_type(self, shape):
+        shape = tuple(shape)
         try:
-            type_ = types[inp.shape]
+            return self._types_by_shape[shape]
         except KeyError:
-            raise Ex(
-                "Tensor shape not supported." "\n Supported shapes: {}".format(types)
-            )
-        return type_
+            pass
 
-    def _get_to_mandel6_func(self, inp):
-        type_ = self._get_type_by_shape(inp)
+        for trailing_shape, type_ in self._types_by_trailing_shape:
+            if shape[-len(trailing_shape) :] == trailing_shape:
+                return type_
 
-        functions = {
-            "t_2": self._tensor2_to_mandel6,
-            "t_4": self._tensor4_to_mandel6,
-            "m6_2": self._pass_through,
-            "m6_4": self._pass_through,
-            "m9_2": self._mandel9_2_to_mandel6,
-            "m9_4": self._mandel9_4_to_mandel6,
-        }
-        return functions[type_]
+        raise Ex(
+            "Tensor shape not supported."
+            "\n Supported shapes: {}".format(self._types_by_shape)
+        )
 
-    def _get_to_mandel9_func(self, inp):
-        type_ = self._get_type_by_shape(inp)
+    def _get_to_mandel6_func(self, inp):
+        return self._to_mandel6_functions[self._get_type_by_shape(inp)]
 
-        functions = {
-            "t_2": self._tensor2_to_mandel9,
-            "t_4": self._tensor4_to_mandel9,
-            "m6_2": self._mandel6_2_to_mandel9,
-            "m6_4": self._mandel6_4_to_mandel9,
-            "m9_2": self._pass_through,
-            "m9_4": self._pass_through,
-        }
-        return functions[type_]
+    def _get_to_mandel9_func(self, inp):
+        return self._to_mandel9_functions[self._get_type_by_shape(inp)]
 
     def _get_to_tensor_func(self, inp):
-        type_ = self._get_type_by_shape(inp)
-
-        functions = {
-            "t_2": self._pass_through,
-            "t_4": self._pass_through,
-            "m6_2": self._mandel6_2_to_tensor,
-            "m6_4": self._mandel6_4_to_tensor,
-            "m9_2": self._mandel9_2_to_tensor,
-            "m9_4": self._mandel9_4_to_tensor,
-        }
-        return functions[type_]
+        return self._to_tensor_functions[self._get_type_by_shape(inp)]
 
     def _pass_through(self, inp):
-        """Do nothing, return argument"""
-        return inp
-
-    def _tensor2_to_mandel(self, inp, base):
-        out = np.einsum("aij, ij ->a", base, inp,)
-        return out
+        """Return argument, cast to dtype if necessary"""
+        return np.asarray(inp, dtype=self.dtype)
 
     def _tensor4_to_mandel(self, inp, base):
-        out = np.einsum("aij, ijkl, bkl ->ab", base, inp, base,)
-        return out
+        """Contract inp with base over both index pairs like np.tensordot,
+        evaluated directly as two matrix products on the (n, 9) base"""
+
+        matrix = inp.reshape(inp.shape[:-4] + 2 * (self.DIM ** 2,))
+        return np.matmul(np.matmul(base, matrix), base.T)
+
+    def _mandel_4_to_tensor(self, inp, base):
+        matrix = np.matmul(np.matmul(base.T, inp), base)
+        return matrix.reshape(inp.shape[:-2] + 4 * (self.DIM,))
 
     def _tensor2_to_mandel6(self, inp):
-        return self._tensor2_to_mandel(inp=inp, base=self.BASE6)
+        inp = np.asarray(inp, dtype=self.dtype)
+        if inp.ndim == 2:
+            f = self.factor
+            return np.array(
+                [
+                    inp[0, 0],
+                    inp[1, 1],
+                    inp[2, 2],
+                    f * (inp[1, 2] + inp[2, 1]),
+                    f * (inp[0, 2] + inp[2, 0]),
+                    f * (inp[0, 1] + inp[1, 0]),
+                ],
+                dtype=self.dtype,
+            )
+
+        upper, lower = self._tensor2_to_mandel6_index
+        return (inp[upper] + inp[lower]) * self._tensor2_to_mandel6_scale
 
     def _tensor2_to_mandel9(self, inp):
-        return self._tensor2_to_mandel(inp=inp, base=self.BASE9)
+        inp = np.asarray(inp, dtype=self.dtype)
+        if inp.ndim == 2:
+            f = self.factor
+            return np.array(
+                [
+                    inp[0, 0],
+                    inp[1, 1],
+                    inp[2, 2],
+                    f * (inp[1, 2] + inp[2, 1]),
+                    f * (inp[0, 2] + inp[2, 0]),
+                    f * (inp[0, 1] + inp[1, 0]),
+                    f * (inp[2, 1] - inp[1, 2]),
+                    f * (inp[0, 2] - inp[2, 0]),
+                    f * (inp[1, 0] - inp[0, 1]),
+                ],
+                dtype=self.dtype,
+            )
 
-    def _tensor4_to_mandel6(self, inp):
-        return self._tensor4_to_mandel(inp=inp, base=self.BASE6)
+        (upper, c_upper), (lower, c_lower) = self._tensor2_to_mandel9_terms
+        return inp[upper] * c_upper + inp[lower] * c_lower
 
-    def _tensor4_to_mandel9(self, inp):
-        return self._tensor4_to_mandel(inp=inp, base=self.BASE9)
+    def _tensor4_to_mandel6(self, inp):
+        inp = np.asarray(inp, dtype=self.dtype)
+        kernel = None
+        if inp.ndim == 4:
+            kernel = _get_kernel("tensor4_to_mandel6", inp.dtype)
+        if kernel is not None:
+            out = np.empty(2 * (self.DIM_MANDEL6,), dtype=self.dtype)
+            kernel(inp, out)
+            return out
 
-    def _mandel_2_to_tensor(self, inp, base):
-        out = np.einsum("ajk, a->jk", base, inp,)
-        return out
+        return self._tensor4_to_mandel(inp=inp, base=self._base6_matrix)
 
-    def _mandel_4_to_tensor(self, inp, base):
-        out = np.einsum("ajk, ab, bmn->jkmn", base, inp, base,)
-        return out
+    def _tensor4_to_mandel9(self, inp):
+        inp = np.asarray(inp, dtype=self.dtype)
+        return self._tensor4_to_mandel(inp=inp, base=self._base9_matrix)
 
     def _mandel6_2_to_tensor(self, inp):
-        return self._mandel_2_to_tensor(inp=inp, base=self.BASE6)
+        inp = np.asarray(inp, dtype=self.dtype)
+        if inp.ndim == 1:
+            f = self.factor
+            return np.array(
+                [
+                    [inp[0], f * inp[5], f * inp[4]],
+                    [f * inp[5], inp[1], f * inp[3]],
+                    [f * inp[4], f * inp[3], inp[2]],
+                ],
+                dtype=self.dtype,
+            )
+
+        gathered = inp[self._mandel6_2_to_tensor_index]
+        return gathered * self._mandel6_2_to_tensor_scale
 
     def _mandel6_4_to_tensor(self, inp):
-        return self._mandel_4_to_tensor(inp=inp, base=self.BASE6)
+        inp = np.asarray(inp, dtype=self.dtype)
+        if inp.ndim == 2:
+            kernel = _get_kernel("mandel6_4_to_tensor", inp.dtype)
+            if kernel is not None:
+                out = np.empty(4 * (self.DIM,), dtype=self.dtype)
+                kernel(inp, out)
+                return out
+
+            gathered = inp.ravel().take(self._mandel6_4_to_tensor_flat_index)
+            out = gathered * self._mandel6_4_to_tensor_flat_scale
+            return out.reshape(4 * (self.DIM,))
+
+        return self._mandel_4_to_tensor(inp=inp, base=self._base6_matrix)
 
     def _mandel9_2_to_tensor(self, inp):
-        return self._mandel_2_to_tensor(inp=inp, base=self.BASE9)
+        inp = np.asarray(inp, dtype=self.dtype)
+        if inp.ndim == 1:
+            f = self.factor
+            return np.array(
+                [
+                    [inp[0], f * (inp[5] - inp[8]), f * (inp[4] + inp[7])],
+                    [f * (inp[5] + inp[8]), inp[1], f * (inp[3] - inp[6])],
+                    [f * (inp[4] - inp[7]), f * (inp[3] + inp[6]), inp[2]],
+                ],
+                dtype=self.dtype,
+            )
+
+        (sym, c_sym), (skw, c_skw) = self._mandel9_2_to_tensor_terms
+        return inp[sym] * c_sym + inp[skw] * c_skw
 
     def _mandel9_4_to_tensor(self, inp):
-        return self._mandel_4_to_tensor(inp=inp, base=self.BASE9)
+        inp = np.asarray(inp, dtype=self.dtype)
+        return self._mandel_4_to_tensor(inp=inp, base=self._base9_matrix)
+
+    def _check_out(self, out, shape):
+        if out.shape != shape or out.dtype != self._numpy_dtype:
+            raise Ex(
+                "Output not supported."
+                "\n Expected shape {} and dtype {}, got shape {} and dtype {}".format(
+                    shape, self._numpy_dtype, out.shape, out.dtype
+                )
+            )
 
-    def _mandel6_2_to_mandel9(self, inp):
-        zeros = np.zeros((self.DIM_MANDEL9,), dtype=self.dtype)
-        zeros[self.SLICE6] = inp
-        return zeros
+    def _mandel6_2_to_mandel9(self, inp, out=None):
+        """Embed inp in Mandel9 notation.
+        A preallocated out is reused and only its skew part is zeroed."""
+
+        shape = inp.shape[:-1] + (self.DIM_MANDEL9,)
+        if out is None:
+            out = np.zeros(shape, dtype=self.dtype)
+        else:
+            self._check_out(out, shape)
+            out[..., self.SLICE_SKW] = 0.0
+        out[..., self.SLICE6] = inp
+        return out
 
-    def _mandel6_4_to_mandel9(self, inp):
-        zeros = np.zeros((self.DIM_MANDEL9, self.DIM_MANDEL9), dtype=self.dtype,)
-        zeros[self.SLICE6, self.SLICE6] = inp
-        return zeros
+    def _mandel6_4_to_mandel9(self, inp, out=None):
+        """Embed inp in Mandel9 notation.
+        A preallocated out is reused and only its skew parts are zeroed."""
+
+        shape = inp.shape[:-2] + (self.DIM_MANDEL9, self.DIM_MANDEL9)
+        if out is None:
+            out = np.zeros(shape, dtype=self.dtype)
+        else:
+            self._check_out(out, shape)
+            out[..., self.SLICE_SKW, :] = 0.0
+            out[..., self.SLICE6, self.SLICE_SKW] = 0.0
+        out[..., self.SLICE6, self.SLICE6] = inp
+        return out
 
     def _mandel9_2_to_mandel6(self, inp):
-        return inp[self.SLICE6]
+        inp = np.asarray(inp, dtype=self.dtype)
+        return inp[..., self.SLICE6]
 
     def _mandel9_4_to_mandel6(self, inp):
-        return inp[self.SLICE6, self.SLICE6]
+        inp = np.asarray(inp, dtype=self.dtype)
+        return inp[..., self.SLICE6, self.SLICE6]
 
 
 class VoigtConverter(Converter):
@@ -720,12 +1222,28 @@ class VoigtConverter(Converter):
 
         super(type(self), self).__init__()
 
+        # Factors of all components combined into one scale array per type
+        shapes = {
+            "stress": (self.DIM_MANDEL6,),
+            "strain": (self.DIM_MANDEL6,),
+            "stiffness": 2 * (self.DIM_MANDEL6,),
+            "compliance": 2 * (self.DIM_MANDEL6,),
+        }
+        self._scales_mandel_to_voigt = {}
+        self._scales_voigt_to_mandel = {}
+        for voigt_type, factors in self.factors_mandel_to_voigt.items():
+            scale = np.ones(shapes[voigt_type], dtype=self.dtype)
+            for position, factor in factors:
+                scale[position] = factor
+            self._scales_mandel_to_voigt[voigt_type] = scale
+            self._scales_voigt_to_mandel[voigt_type] = 1.0 / scale
+
     def mandel6_to_voigt(self, inp, voigt_type):
         """Transform Mandel to Voigt depending on voigt_type.
 
         Parameters
         ----------
-        inp : np.array with shape (6,) or (6, 6) consistent with voigt_type
+        inp : np.array with shape (..., 6) or (..., 6, 6) consistent with voigt_type
                 Mandel representation
 
         voigt_type : string
@@ -738,18 +1256,14 @@ class VoigtConverter(Converter):
                 Voigt representation
         """
 
-        voigt = inp.copy()
-        for position, factor in self.factors_mandel_to_voigt[voigt_type]:
-            voigt[position] = inp[position] * factor
-
-        return voigt
+        return inp * self._scales_mandel_to_voigt[voigt_type]
 
     def voigt_to_mandel6(self, inp, voigt_type):
         """Transform Voigt to Mandel depending on voigt_type.
 
         Parameters
         ----------
-        inp : np.array with shape (6,) or (6, 6) consistent with voigt_type
+        inp : np.array with shape (..., 6) or (..., 6, 6) consistent with voigt_type
                 Voigt representation
 
         voigt_type : string
@@ -762,11 +1276,7 @@ class VoigtConverter(Converter):
                 Mandel representation
         """
 
-        mandel = inp.copy()
-        for position, factor in self.factors_mandel_to_voigt[voigt_type]:
-            mandel[position] = inp[position] * 1.0 / factor
-
-        return mandel
+        return inp * self._scales_voigt_to_mandel[voigt_type]
 
 
 if __name__ == "__main__":
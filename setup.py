@@ -15,6 +15,7 @@ setuptools.setup(
     url="https://github.com/JulianKarlBauer/mechkit",
     packages=setuptools.find_packages(),
     install_requires=["numpy",],
+    extras_require={"numba": ["numba"]},
     classifiers=[
         "Programming Language :: Python",
         "License :: OSI Approved :: MIT License",
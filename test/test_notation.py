@@ -41,6 +41,70 @@ def test_unsupported_shape():
     )
 
 
+def test_compile_unsupported_shape():
+
+    con = mechkit.notation.Converter()
+    assertException(
+        con.compile_to_mandel6,
+        "Tensor shape not supported",
+        args=[],
+        kwargs={"shape": (3, 2)},
+        exception=mechkit.utils.Ex,
+    )
+
+
+def test_compile_equals_conversion():
+
+    con = mechkit.notation.Converter()
+
+    funcs = {
+        con.compile_to_tensor: con.to_tensor,
+        con.compile_to_mandel6: con.to_mandel6,
+        con.compile_to_mandel9: con.to_mandel9,
+    }
+
+    for shape in [(3, 3), (3, 3, 3, 3), (6,), (6, 6), (9,), (9, 9)]:
+        inp = np.random.rand(*shape)
+        for compile_func, func in funcs.items():
+            f = compile_func(shape=shape)
+            assert np.allclose(f(inp), func(inp))
+
+
+def test_bases_shared_and_read_only():
+
+    con = mechkit.notation.Converter()
+    other = mechkit.notation.Converter()
+
+    assert con.BASE6 is other.BASE6
+    assert con.BASE9 is other.BASE9
+    with pytest.raises(ValueError):
+        con.BASE6[0, 0, 0] = 2.0
+
+
+def test_mandel6_to_mandel9_into_out():
+
+    con = mechkit.notation.Converter()
+
+    for shape in [(6,), (6, 6)]:
+        to_mandel9 = con.compile_to_mandel9(shape=shape)
+        inp = np.random.rand(*shape)
+        out = np.random.rand(*((9,) * len(shape)))
+
+        result = to_mandel9(inp, out=out)
+
+        assert result is out
+        assert np.allclose(result, con.to_mandel9(inp))
+
+        for wrong_out in [out.astype(np.float32), np.empty((9,) * len(shape) + (1,))]:
+            assertException(
+                to_mandel9,
+                "Output not supported",
+                args=[inp],
+                kwargs={"out": wrong_out},
+                exception=mechkit.utils.Ex,
+            )
+
+
 def test_compare_P1_P2_mandel6_tensor():
 
     con = mechkit.notation.Converter()
@@ -134,6 +198,120 @@ def test_pass_throught():
     assert np.allclose(con.to_tensor(t4), t4)
 
 
+def test_batch_equals_loop():
+
+    con = mechkit.notation.Converter()
+
+    funcs = [con.to_tensor, con.to_mandel6, con.to_mandel9]
+
+    for shape in [(3, 3), (3, 3, 3, 3), (6,), (6, 6), (9,), (9, 9)]:
+        batch = np.random.rand(*((4, 2) + shape))
+        for func in funcs:
+            looped = np.array([[func(inp) for inp in row] for row in batch])
+            assert np.allclose(func(batch), looped)
+
+
+def test_kernels_equal_numpy_fallback(monkeypatch):
+
+    con = mechkit.notation.Converter()
+    base = con.BASE6
+
+    t4 = np.random.rand(3, 3, 3, 3)
+    m6_4 = np.random.rand(6, 6)
+
+    expected = {
+        con.to_mandel6: (t4, np.einsum("aij,ijkl,bkl->ab", base, t4, base)),
+        con.to_tensor: (m6_4, np.einsum("aij,ab,bkl->ijkl", base, m6_4, base)),
+    }
+
+    # Force numpy fallback
+    monkeypatch.setattr(mechkit.notation, "_kernels", {})
+    fallback = {}
+    for func, (inp, reference) in expected.items():
+        fallback[func] = func(inp)
+        assert np.allclose(fallback[func], reference)
+
+    # Compile kernels anew
+    pytest.importorskip("numba")
+    monkeypatch.setattr(mechkit.notation, "_kernels", None)
+    for name in ["tensor4_to_mandel6", "mandel6_4_to_tensor"]:
+        kernel = mechkit.notation._get_kernel(name, np.dtype("float64"))
+        assert kernel is not None
+
+    for func, (inp, reference) in expected.items():
+        assert np.allclose(func(inp), fallback[func])
+
+
+def test_dtype():
+
+    con64 = mechkit.notation.Converter()
+
+    # float16 and longdouble are not supported by numba kernels
+    tolerances = {"float32": 1e-5, "float16": 1e-2, "longdouble": 1e-12}
+
+    for dtype, tol in tolerances.items():
+        con = mechkit.notation.Converter(dtype=dtype)
+
+        funcs = {
+            con.to_tensor: con64.to_tensor,
+            con.to_mandel6: con64.to_mandel6,
+            con.to_mandel9: con64.to_mandel9,
+        }
+
+        for shape in [(3, 3), (3, 3, 3, 3), (6,), (6, 6), (9,), (9, 9)]:
+            for batch in [(), (2,)]:
+                inp = np.random.rand(*(batch + shape))
+                for func, func64 in funcs.items():
+                    out = func(inp)
+                    assert out.dtype == np.dtype(dtype)
+                    assert np.allclose(out, func64(inp), rtol=tol, atol=tol)
+
+
+def test_pass_through_returns_input():
+
+    con = mechkit.notation.Converter()
+
+    funcs = {
+        con.to_tensor: [(3, 3), (3, 3, 3, 3)],
+        con.to_mandel6: [(6,), (6, 6)],
+        con.to_mandel9: [(9,), (9, 9)],
+    }
+
+    for func, shapes in funcs.items():
+        for shape in shapes:
+            inp = np.random.rand(*shape)
+            assert func(inp) is inp
+            assert func(func(inp)) is inp
+
+
+def test_is_notation():
+
+    con = mechkit.notation.Converter()
+
+    checks = {
+        con.is_tensor: [(3, 3), (3, 3, 3, 3), (2, 3, 3)],
+        con.is_mandel6: [(6,), (6, 6), (2, 6, 6)],
+        con.is_mandel9: [(9,), (9, 9), (2, 9)],
+    }
+
+    for check, shapes in checks.items():
+        for other_check, other_shapes in checks.items():
+            for shape in other_shapes:
+                assert check(np.ones(shape)) == (check == other_check)
+        assert not check(np.ones((3, 2)))
+
+
+def test_level2_mandel9_tensor_equals_base():
+
+    con = mechkit.notation.Converter()
+
+    t2 = np.random.rand(3, 3)
+    m9 = np.random.rand(9)
+
+    assert np.allclose(con.to_mandel9(t2), np.einsum("aij,ij->a", con.BASE9, t2))
+    assert np.allclose(con.to_tensor(m9), np.einsum("ajk,a->jk", con.BASE9, m9))
+
+
 def test_mandel6_to_tensor_to_mandel6():
 
     con = mechkit.notation.Converter()
@@ -146,17 +324,36 @@ def test_tensor_to_mandel6_to_tensor():
     con = mechkit.notation.Converter()
 
     tensor = np.random.rand(3, 3, 3, 3)
-    tensor_sym_minor = 0.25 * (
-        tensor.transpose([0, 1, 2, 3])
-        + tensor.transpose([1, 0, 2, 3])
-        + tensor.transpose([0, 1, 3, 2])
-        + tensor.transpose([1, 0, 3, 2])
-    )
+    tensor_sym_minor = tensor.copy()
+    tensor_sym_minor += tensor.transpose([1, 0, 2, 3])
+    tensor_sym_minor += tensor.transpose([0, 1, 3, 2])
+    tensor_sym_minor += tensor.transpose([1, 0, 3, 2])
+    tensor_sym_minor *= 0.25
+    assert np.allclose(tensor_sym_minor, con.symmetrize_minor(tensor))
     matrix = con.to_mandel6(tensor_sym_minor)
 
     assert np.allclose(con.to_tensor(matrix), tensor_sym_minor)
 
 
+def test_symmetrize_minor():
+
+    con = mechkit.notation.Converter()
+    tensor = np.random.rand(3, 3, 3, 3)
+    sym = con.symmetrize_minor(tensor)
+
+    assert np.allclose(sym, sym.transpose([1, 0, 2, 3]))
+    assert np.allclose(sym, sym.transpose([0, 1, 3, 2]))
+    assert np.allclose(sym, con.to_tensor(con.to_mandel6(tensor)))
+    assert np.allclose(con.symmetrize_minor(sym), sym)
+
+    con32 = mechkit.notation.Converter(dtype="float32")
+    for inp in [tensor, tensor.astype(np.float32)]:
+        sym32 = con32.symmetrize_minor(inp)
+        assert sym32.dtype == np.float32
+        assert np.allclose(sym32, sym, rtol=1e-5, atol=1e-6)
+    assert con.symmetrize_minor(tensor.astype(np.float32)).dtype == np.float64
+
+
 def test_mandel9_to_tensor_to_mandel9():
 
     con = mechkit.notation.Converter()